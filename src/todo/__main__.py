@@ -5,21 +5,46 @@ The main entry point to the application.
 import enum
 import logging
 import os
-import pathlib
-import sqlite3
 import sys
-from importlib.metadata import metadata, packages_distributions, version
-from typing import Sequence
+from typing import Any, Sequence
 
-from .args import setup_parser
-from .context import Context
+from .args import parse_args
+from .daemon import request, socket_path
 from .logger import level_from_directive, setup_logger
-from .pyproject import pyproject_init
-from .subcommand import subcommand_registry
+from .queries import PRAGMAS
 from .verbosity import Verbosity
 
 log = logging.getLogger(__name__)
 
+if sys.platform == "linux":
+    _DATA_DIR = os.path.join(
+        os.path.expanduser("~"), ".local", "share", "todo"
+    )
+else:
+    # TODO: Update to use the proper paths on each platform.
+    _DATA_DIR = os.path.join(os.path.expanduser("~"), ".todo")
+
+_DATABASE = os.path.join(_DATA_DIR, "todo.sqlite3")
+
+# `__package__` is always set here, otherwise the relative imports at the top
+# of this module would have failed.
+_LOG_ENV_VAR = f"{__package__}_LOG".upper()
+_DEFAULT_LEVEL = logging.WARNING
+
+
+def __getattr__(name: str) -> Any:
+    # These are rarely needed, so they are only imported on first access.
+    if name in ("metadata", "packages_distributions", "version"):
+        import importlib.metadata
+
+        return getattr(importlib.metadata, name)
+    elif name == "pyproject_init":
+        from .pyproject import pyproject_init
+
+        return pyproject_init
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 class ExitCode(enum.IntEnum):
     """Describes the status of the program after it has terminated.
@@ -61,23 +86,23 @@ def main(argv: Sequence[str] = sys.argv[1:]) -> ExitCode:
     the program is installed with a wrapper script on `PATH` that calls this
     function without arguments.
     """
-    parser = setup_parser()
-    args = parser.parse_args(argv)
+    args = parse_args(argv)
 
     verbosity = Verbosity.from_args(args.verbose, args.quiet)
-    handlers = [logging.StreamHandler(sys.stderr)]
-    assert all(map(lambda h: isinstance(h, logging.Handler), handlers))
+    handlers: list[logging.Handler] = [logging.StreamHandler(sys.stderr)]
 
     match verbosity:
         case Verbosity.SILENT:
             logging.disable()
         case Verbosity.DEFAULT:
-            fallback = Verbosity.DEFAULT.to_level_name()
-            assert fallback is not None
-            assert __package__ is not None
-            directive = os.getenv(f"{__package__.upper()}_LOG", fallback)
-
-            if (level := level_from_directive(directive)) is None:
+            directive = os.environ.get(_LOG_ENV_VAR)
+            level = (
+                _DEFAULT_LEVEL
+                if directive is None
+                else level_from_directive(directive)
+            )
+
+            if level is None:
                 logging.disable()
             else:
                 setup_logger(level, handlers)
@@ -86,23 +111,37 @@ def main(argv: Sequence[str] = sys.argv[1:]) -> ExitCode:
             assert level is not None
             setup_logger(level, handlers)
 
-    if sys.platform == "linux":
-        data_dir = pathlib.Path.home().joinpath(".local", "share", "todo")
-    else:
-        # TODO: Update to use the proper paths on each platform.
-        data_dir = pathlib.Path.home().joinpath(".todo")
+    if (
+        args.subcommand != "daemon"
+        and (path := socket_path()) is not None
+        and (response := request(path, argv)) is not None
+    ):
+        log.debug("command was handled by the daemon")
+        _ = sys.stderr.write(response["stderr"])
+        _ = sys.stdout.write(response["stdout"])
+        return ExitCode(response["status"])
+
+    # Only needed once the arguments are known to be valid.
+    import sqlite3
+
+    from .context import Context
+
+    if not os.path.isdir(_DATA_DIR):
+        os.makedirs(_DATA_DIR, exist_ok=True)
+
+    connection = sqlite3.connect(_DATABASE, cached_statements=128)
 
-    data_dir.mkdir(parents=True, exist_ok=True)
+    for pragma in PRAGMAS:
+        connection.execute(pragma)
 
-    database = data_dir.joinpath("todo.sqlite3")
-    connection = sqlite3.connect(database)
     ctx = Context(connection)
 
-    assert hasattr(args, "subcommand")
-    assert isinstance(args.subcommand, str), type(args.subcommand)
-    assert args.subcommand in subcommand_registry, subcommand_registry.keys()
-    subcommand = subcommand_registry[args.subcommand]
-    subcommand.from_args(args).run(ctx)
+    try:
+        args.command.run(ctx)
+    except RuntimeError as exc:
+        # e.g., `todo daemon` when the daemon is already running.
+        _ = sys.stderr.write(f"error: {exc}\n")
+        return ExitCode.FAILURE
 
     return ExitCode.SUCCESS
 
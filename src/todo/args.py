@@ -2,13 +2,111 @@
 This module implements the command-line argument parser.
 """
 
-import argparse
+from __future__ import annotations
 
-from .commands import register_subcommands
+import sys
+import types
+from typing import TYPE_CHECKING, Sequence
+
+from .commands import load_subcommand, register_subcommands
+from .subcommand import Subcommand, subcommand_registry
+
+if TYPE_CHECKING:
+    import argparse
+
+
+def parse_args(argv: Sequence[str]) -> types.SimpleNamespace:
+    """Parse the command-line arguments.
+
+    Well-formed arguments are handled in a single pass without importing
+    [`argparse`][argparse]. Anything else (e.g., `--help` or a typo) is
+    handed over to the parser from [`setup_parser`], which either accepts
+    the arguments or reports the error and exits.
+
+    Parameters
+    ----------
+    argv
+        Command-line arguments.
+
+    Returns
+    -------
+    types.SimpleNamespace
+        Has the attributes `verbose` and `quiet` (the number of times each
+        option was used), `subcommand` (the name of the subcommand), and
+        `command` (the [`Subcommand`] to run).
+    """
+    try:
+        return _parse_args_fast(argv)
+    except ValueError:
+        pass
+
+    parser = setup_parser()
+
+    # The first subcommand name is the one that was selected. (There may be
+    # none, e.g., for `todo --help`.)
+    for arg in argv:
+        if arg in subcommand_registry:
+            Subcommand.materialize(arg)
+            break
+
+    args = parser.parse_args(argv)
+    subcommand = sys.intern(args.subcommand)
+    command = load_subcommand(subcommand).from_args(args)
+
+    return types.SimpleNamespace(
+        verbose=args.verbose,
+        quiet=args.quiet,
+        subcommand=subcommand,
+        command=command,
+    )
+
+
+def _parse_args_fast(argv: Sequence[str]) -> types.SimpleNamespace:
+    verbose = 0
+    quiet = 0
+    it = iter(argv)
+
+    for arg in it:
+        if arg == "--verbose":
+            verbose += 1
+        elif arg == "--quiet":
+            quiet += 1
+        elif arg[:1] == "-":
+            # Short options may be grouped together (e.g., `-vv`).
+            if not arg[1:] or arg[1:].strip("vq"):
+                raise ValueError(f"unrecognized argument: {arg}")
+
+            verbose += arg.count("v")
+            quiet += arg.count("q")
+        else:
+            # Interned like the names it is looked up against, so the lookup
+            # can match by identity.
+            name = sys.intern(arg)
+            break
+    else:
+        raise ValueError("a subcommand is required")
+
+    try:
+        subcommand = load_subcommand(name)
+    except KeyError:
+        raise ValueError(f"invalid subcommand: {name}") from None
+
+    return types.SimpleNamespace(
+        verbose=verbose,
+        quiet=quiet,
+        subcommand=name,
+        command=subcommand.parse_argv(list(it)),
+    )
 
 
 def setup_parser() -> argparse.ArgumentParser:
-    """Configure the command-line argument parser."""
+    """Configure the command-line argument parser.
+
+    This is only needed for `--help` and for reporting invalid arguments;
+    see [`parse_args`].
+    """
+    import argparse
+
     parser = argparse.ArgumentParser()
 
     parser.add_argument(
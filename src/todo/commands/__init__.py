@@ -1,31 +1,67 @@
 """
 This module implements the CLI subcommands.
+
+The subcommands are imported on demand (see [`load_subcommand`]) so that
+running one subcommand does not pay for importing all of the others.
 """
 
-import argparse
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import argparse
+
+    from ..subcommand import Subcommand
+
+SUBCOMMAND_MODULES: dict[str, tuple[str, str]] = {
+    "add": (".add", "Add"),
+    "complete": (".complete", "Complete"),
+    "daemon": (".daemon", "Daemon"),
+    "delete": (".delete", "Delete"),
+    "edit": (".edit", "Edit"),
+    "list": (".list", "List"),
+    "reopen": (".reopen", "Reopen"),
+}
 
-from ..subcommand import Subcommand
-from .add import Add
-from .complete import Complete
-from .delete import Delete
-from .edit import Edit
-from .list import List
-from .reopen import Reopen
+
+def load_subcommand(name: str) -> type[Subcommand]:
+    """Import the class that implements a subcommand.
+
+    Parameters
+    ----------
+    name
+        The name of the subcommand, as typed on the command-line.
+
+    Returns
+    -------
+    type[Subcommand]
+        The class that implements the subcommand.
+
+    Raises
+    ------
+    KeyError
+        There is no subcommand with the given name.
+    """
+    module_name, class_name = SUBCOMMAND_MODULES[name]
+    module = importlib.import_module(module_name, package=__name__)
+    subcommand_cls: type[Subcommand] = getattr(module, class_name)
+    return subcommand_cls
 
 
 def register_subcommands(parent: argparse.ArgumentParser) -> None:
     subcommand_parser = parent.add_subparsers(dest="subcommand", required=True)
-    subcommand_handlers: list[type[Subcommand]] = [
-        Add,
-        Complete,
-        Delete,
-        Edit,
-        List,
-        Reopen,
-    ]
 
-    for subcommand_cls in subcommand_handlers:
-        subcommand_cls.register(parent=subcommand_parser)
+    for name in SUBCOMMAND_MODULES:
+        load_subcommand(name).register(parent=subcommand_parser)
+
 
+def __getattr__(name: str) -> Any:
+    # Keep `from todo.commands import Add` working without importing every
+    # subcommand up front.
+    for subcommand, (_, class_name) in SUBCOMMAND_MODULES.items():
+        if class_name == name:
+            return load_subcommand(subcommand)
 
-del argparse
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
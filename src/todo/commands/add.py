@@ -1,18 +1,30 @@
-import argparse
+from __future__ import annotations
+
 import dataclasses
-import json
 import logging
 import sys
-from typing import Self
+from typing import TYPE_CHECKING, Final, Self, Sequence
 
 from ..context import Context
-from ..subcommand import Subcommand
+from ..json_compat import dumps
+from ..queries import INSERT_TASK
+from ..subcommand import Subcommand, split_argv
 from ..task import Priority, Status, Task
 
+if TYPE_CHECKING:
+    import argparse
+
 log = logging.getLogger(__name__)
 
+_PRIORITY_BY_NAME: Final = {priority.name: priority for priority in Priority}
+_STATUS_BY_NAME: Final = {status.name: status for status in Status}
+_PRIORITY_CHOICES: Final = tuple(_PRIORITY_BY_NAME)
+_STATUS_CHOICES: Final = tuple(_STATUS_BY_NAME)
+_DEFAULT_PRIORITY: Final = Priority.LOW.name
+_DEFAULT_STATUS: Final = Status.PENDING.name
 
-@dataclasses.dataclass
+
+@dataclasses.dataclass(slots=True)
 class Add(Subcommand):
     """Create a new task."""
 
@@ -24,8 +36,29 @@ class Add(Subcommand):
     def from_args(cls, args: argparse.Namespace) -> Self:
         return cls(
             title=args.title,
-            priority=Priority[args.priority],
-            status=Status[args.status],
+            priority=_PRIORITY_BY_NAME[args.priority],
+            status=_STATUS_BY_NAME[args.status],
+        )
+
+    @classmethod
+    def parse_argv(cls, argv: Sequence[str], /) -> Self:
+        options, (title,) = split_argv(
+            argv,
+            options=("--priority", "--status"),
+        )
+        priority = options.get("--priority", _DEFAULT_PRIORITY)
+        status = options.get("--status", _DEFAULT_STATUS)
+
+        if priority not in _PRIORITY_BY_NAME:
+            raise ValueError(f"invalid choice: {priority!r}")
+
+        if status not in _STATUS_BY_NAME:
+            raise ValueError(f"invalid choice: {status!r}")
+
+        return cls(
+            title=title,
+            priority=_PRIORITY_BY_NAME[priority],
+            status=_STATUS_BY_NAME[status],
         )
 
     @classmethod
@@ -39,47 +72,33 @@ class Add(Subcommand):
         parser.add_argument(
             "--priority",
             action="store",
-            default=Priority.LOW.name,
+            default=_DEFAULT_PRIORITY,
             type=str,
-            choices=[e.name for e in Priority],
+            choices=_PRIORITY_CHOICES,
             help="Importance of the task",
         )
         parser.add_argument(
             "--status",
             action="store",
-            default=Status.PENDING.name,
+            default=_DEFAULT_STATUS,
             type=str,
-            choices=[e.name for e in Status],
+            choices=_STATUS_CHOICES,
             help="Current state of the task",
         )
 
     def run(self, ctx: Context, /) -> None:
-        cursor = ctx.connection.cursor()
-        cursor.execute(
-            """
-            INSERT INTO task(title, priority, status)
-            VALUES(?, ?, ?);
-            """,
-            (
-                self.title,
-                self.priority.value,
-                self.status.value,
-            ),
-        )
-        ctx.connection.commit()
-
-        task_id = cursor.lastrowid
-        cursor.execute(
-            """
-            SELECT id, title, priority, status, created_at, updated_at
-            FROM task
-            WHERE id = ?;
-            """,
-            (task_id,),
-        )
+        with ctx.connection:
+            cursor = ctx.connection.execute(
+                INSERT_TASK,
+                (
+                    self.title,
+                    self.priority.value,
+                    self.status.value,
+                ),
+            )
+            data = cursor.fetchone()
 
-        data = cursor.fetchone()
         task = Task.from_data(*data)
 
         _ = sys.stderr.write("Task created successfully!\n\n")
-        _ = sys.stdout.write(json.dumps(task.as_dict(), indent=2) + "\n")
+        _ = sys.stdout.write(dumps(task.as_dict()) + "\n")
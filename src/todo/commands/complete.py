@@ -1,19 +1,24 @@
-import argparse
+from __future__ import annotations
+
 import dataclasses
-import datetime
-import json
 import logging
 import sys
-from typing import Self
+import time
+from typing import TYPE_CHECKING, Self, Sequence
 
 from ..context import Context
-from ..subcommand import Subcommand
+from ..json_compat import dumps
+from ..queries import UPDATE_TASK_STATUS
+from ..subcommand import Subcommand, split_argv
 from ..task import Status, Task
 
+if TYPE_CHECKING:
+    import argparse
+
 log = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Complete(Subcommand):
     """Mark a task as complete."""
 
@@ -25,40 +30,35 @@ class Complete(Subcommand):
             id=args.id,
         )
 
+    @classmethod
+    def parse_argv(cls, argv: Sequence[str], /) -> Self:
+        _, (task_id,) = split_argv(argv)
+        return cls(
+            id=int(task_id),
+        )
+
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser, /) -> None:
         parser.add_argument(
             "id",
             action="store",
-            type=str,
+            type=int,
             help="Unique identifier for the task",
         )
 
     def run(self, ctx: Context, /) -> None:
-        now = datetime.datetime.now()
-        cursor = ctx.connection.cursor()
-        cursor.execute(
-            f"""
-            UPDATE task
-            SET
-                status = {Status.COMPLETED.value},
-                updated_at = {now.timestamp()}
-            WHERE id = ?;
-            """,
-            (self.id,),
-        )
-        ctx.connection.commit()
+        with ctx.connection:
+            cursor = ctx.connection.execute(
+                UPDATE_TASK_STATUS,
+                (Status.COMPLETED.value, time.time(), self.id),
+            )
+            data = cursor.fetchone()
+
+        if data is None:
+            _ = sys.stderr.write(f"No task with ID {self.id} found\n")
+            return
 
-        cursor.execute(
-            """
-            SELECT id, title, priority, status, created_at, updated_at
-            FROM task
-            WHERE id = ?
-            """,
-            (self.id,),
-        )
-        data = cursor.fetchone()
         task = Task.from_data(*data)
 
         _ = sys.stderr.write(f"Completed task with ID {self.id}\n\n")
-        _ = sys.stdout.write(json.dumps(task.as_dict(), indent=2) + "\n")
+        _ = sys.stdout.write(dumps(task.as_dict()) + "\n")
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import dataclasses
+import logging
+from typing import TYPE_CHECKING, Self, Sequence
+
+from ..context import Context
+from ..daemon import serve, socket_path
+from ..subcommand import Subcommand, split_argv
+
+if TYPE_CHECKING:
+    import argparse
+
+log = logging.getLogger(__name__)
+
+
+@dataclasses.dataclass(slots=True)
+class Daemon(Subcommand):
+    """Keep the database open and run commands sent by other invocations.
+
+    While the daemon is running, other invocations of `todo` forward their
+    arguments over a Unix socket in `$XDG_RUNTIME_DIR` instead of opening
+    the database themselves.
+    """
+
+    @classmethod
+    def from_args(cls, args: argparse.Namespace) -> Self:
+        return cls()
+
+    @classmethod
+    def parse_argv(cls, argv: Sequence[str], /) -> Self:
+        _, positionals = split_argv(argv)
+
+        if positionals:
+            raise ValueError(f"unrecognized arguments: {positionals}")
+
+        return cls()
+
+    def run(self, ctx: Context, /) -> None:
+        if (path := socket_path()) is None:
+            raise RuntimeError("the daemon requires XDG_RUNTIME_DIR")
+
+        # Raises `RuntimeError` if another daemon is already running.
+        serve(path, ctx)
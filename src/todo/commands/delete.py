@@ -1,18 +1,23 @@
-import argparse
+from __future__ import annotations
+
 import dataclasses
-import json
 import logging
 import sys
-from typing import Self
+from typing import TYPE_CHECKING, Self, Sequence
 
 from ..context import Context
-from ..subcommand import Subcommand
+from ..json_compat import dumps
+from ..queries import DELETE_TASK_BY_ID
+from ..subcommand import Subcommand, split_argv
 from ..task import Task
 
+if TYPE_CHECKING:
+    import argparse
+
 log = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Delete(Subcommand):
     """Remove a task from the database (permanently)."""
 
@@ -24,6 +29,13 @@ class Delete(Subcommand):
             id=args.id,
         )
 
+    @classmethod
+    def parse_argv(cls, argv: Sequence[str], /) -> Self:
+        _, (task_id,) = split_argv(argv)
+        return cls(
+            id=int(task_id),
+        )
+
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser, /) -> None:
         parser.add_argument(
@@ -34,16 +46,9 @@ class Delete(Subcommand):
         )
 
     def run(self, ctx: Context, /) -> None:
-        cursor = ctx.connection.cursor()
-
-        # TODO: Get the task before deleting so we return it.
-        cursor.execute(
-            """
-            SELECT * FROM task WHERE id = ?;
-            """,
-            (self.id,),
-        )
-        data = cursor.fetchone()
+        with ctx.connection:
+            cursor = ctx.connection.execute(DELETE_TASK_BY_ID, (self.id,))
+            data = cursor.fetchone()
 
         if data is None:
             _ = sys.stderr.write(f"No task with ID {self.id} found\n")
@@ -51,13 +56,5 @@ class Delete(Subcommand):
 
         task = Task.from_data(*data)
 
-        cursor.execute(
-            """
-            DELETE FROM task WHERE id = ?;
-            """,
-            (self.id,),
-        )
-        ctx.connection.commit()
-
         _ = sys.stderr.write(f"Deleted task with ID {self.id}\n\n")
-        _ = sys.stdout.write(json.dumps(task.as_dict(), indent=2) + "\n")
+        _ = sys.stdout.write(dumps(task.as_dict()) + "\n")
@@ -1,17 +1,33 @@
-import argparse
+from __future__ import annotations
+
 import dataclasses
 import enum
-import json
 import logging
 import sys
-from typing import Self, Sequence
+import time
+from typing import TYPE_CHECKING, Final, Self, Sequence
 
 from ..context import Context
-from ..subcommand import Subcommand
-from ..task import Priority, Status, Task
+from ..json_compat import dumps
+from ..subcommand import Subcommand, split_argv
+from ..task import (
+    PRIORITY_NAMES,
+    STATUS_NAMES,
+    Priority,
+    Row,
+    Status,
+    Task,
+    serialize_tasks,
+)
+
+if TYPE_CHECKING:
+    import argparse
 
 log = logging.getLogger(__name__)
 
+_PRIORITY_HIGH: Final = Priority.HIGH.value
+_STATUS_COMPLETED: Final = Status.COMPLETED.value
+
 
 class SortBy(enum.IntEnum):
     """Indicates which column name to sort by."""
@@ -22,7 +38,11 @@ class SortBy(enum.IntEnum):
     CREATED_AT = enum.auto()
 
 
-@dataclasses.dataclass
+_SORT_BY_CHOICES: Final = tuple(e.name.lower() for e in SortBy)
+_DEFAULT_SORT_BY: Final = SortBy.PRIORITY.name.lower()
+
+
+@dataclasses.dataclass(slots=True)
 class List(Subcommand):
     """Show tasks."""
 
@@ -34,20 +54,42 @@ class List(Subcommand):
     @classmethod
     def from_args(cls, args: argparse.Namespace) -> Self:
         return cls(
-            sort_by=args.sort_by,
+            sort_by=SortBy[args.sort_by.upper()],
             reverse=args.reverse,
             as_json=args.json,
             show_all=args.all,
         )
 
+    @classmethod
+    def parse_argv(cls, argv: Sequence[str], /) -> Self:
+        options, positionals = split_argv(
+            argv,
+            options=("--sort-by",),
+            flags=("--reverse", "--json", "--all"),
+        )
+        sort_by = options.get("--sort-by", _DEFAULT_SORT_BY)
+
+        if positionals:
+            raise ValueError(f"unrecognized arguments: {positionals}")
+
+        if sort_by not in _SORT_BY_CHOICES:
+            raise ValueError(f"invalid choice: {sort_by!r}")
+
+        return cls(
+            sort_by=SortBy[sort_by.upper()],
+            reverse="--reverse" in options,
+            as_json="--json" in options,
+            show_all="--all" in options,
+        )
+
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser, /) -> None:
         parser.add_argument(
             "--sort-by",
             action="store",
-            default=SortBy.PRIORITY,
-            type=SortBy,
-            choices=[e.name.lower() for e in SortBy],
+            default=_DEFAULT_SORT_BY,
+            type=str,
+            choices=_SORT_BY_CHOICES,
             help="",
         )
         parser.add_argument(
@@ -71,129 +113,115 @@ class List(Subcommand):
             # When sorting by priority, we want to see important tasks first.
             self.reverse = not self.reverse
 
-        desc = "DESC" if self.reverse else "ASC"
-
         cursor = ctx.connection.cursor()
-        cursor.execute(
-            f"""
-            SELECT id, title, priority, status, created_at, updated_at
-            FROM task
-            {f"WHERE status != {Status.COMPLETED.value}" if not self.show_all else ""}
-            ORDER BY
-                {self.sort_by.name.lower()} {desc},
-                CASE
-                    WHEN status = {Status.COMPLETED.value} THEN 3
-                    WHEN priority = {Priority.HIGH.value} AND status != {Status.COMPLETED.value} THEN 1
-                    ELSE 2
-                END {desc},
-                priority {desc},
-                status {desc}
-            """,
-            (),
-        )
+        cursor.execute(_QUERIES[self.sort_by, self.reverse, self.show_all])
 
-        tasks = [Task.from_data(*data) for data in cursor.fetchall()]
+        rows: list[Row] = cursor.fetchall()
 
         if self.as_json:
-            content = json.dumps([task.as_dict() for task in tasks], indent=2)
+            content = dumps(serialize_tasks(Task.from_rows(rows)))
             _ = sys.stdout.write(content + "\n")
             return
         else:
-            _ = sys.stdout.write("\n".join(render_table(tasks=tasks)) + "\n")
-
-
-def render_table(tasks: Sequence[Task]) -> list[str]:
-    width_id = max(2, len(str(len(tasks))))
-    # Doubling the initial value handles the case where `tasks` is empty
-    # since `*[]` resolves into `` (nothing) and the `int` by itself is not
-    # a valid argument for `max` because it's not an iterable.
-    width_title = max(5, 5, *[len(t.title) for t in tasks])
-    width_priority = max(8, 8, *[len(t.priority.name) for t in tasks])
-    width_status = max(6, 6, *[len(t.status.name) for t in tasks])
-    # Length of datetime in ISO-8601 format else length of "Created at".
-    width_created_at = 24 if len(tasks) > 0 else 10
-    # Length of datetime in ISO-8601 format else length of "Updated at".
-    width_updated_at = 24 if len(tasks) > 0 else 10
+            _ = sys.stdout.write(render_table(rows=rows))
+
+
+def _build_query(sort_by: SortBy, reverse: bool, show_all: bool) -> str:
+    desc = "DESC" if reverse else "ASC"
+
+    return f"""
+        SELECT id, title, priority, status, created_at, updated_at
+        FROM task
+        {f"WHERE status != {_STATUS_COMPLETED}" if not show_all else ""}
+        ORDER BY
+            {sort_by.name.lower()} {desc},
+            CASE
+                WHEN status = {_STATUS_COMPLETED} THEN 3
+                WHEN priority = {_PRIORITY_HIGH} AND status != {_STATUS_COMPLETED} THEN 1
+                ELSE 2
+            END {desc},
+            priority {desc},
+            status {desc}
+    """
+
+
+# There are only 16 possible queries, so they are all built up front; this
+# also keeps their text identical between calls so `sqlite3` can reuse them.
+_QUERIES: dict[tuple[SortBy, bool, bool], str] = {
+    (sort_by, reverse, show_all): _build_query(sort_by, reverse, show_all)
+    for sort_by in SortBy
+    for reverse in (False, True)
+    for show_all in (False, True)
+}
+
+
+def _format_timestamp(timestamp: float) -> str:
+    # Equivalent to `Task.created_at.strftime(...)`, without having to
+    # construct a `datetime` (and resolve the local timezone) for every row.
+    return time.strftime("%Y-%m-%dT%H:%M:%S%z", time.localtime(timestamp))
+
+
+def render_table(rows: Sequence[Row]) -> str:
+    # Format the cells and measure the columns in a single pass, straight
+    # from the rows returned by the database, rather than constructing a
+    # `Task` for each row. The initial widths are those of the headers.
+    width_id = 2
+    width_title = 5
+    width_priority = 8
+    width_status = 6
+    width_created_at = 10
+    width_updated_at = 10
+    cells: list[tuple[str, str, str, str, str, str]] = []
+
+    for row in rows:
+        id = str(row[0])
+        title = row[1]
+        priority = PRIORITY_NAMES[row[2]]
+        status = STATUS_NAMES[row[3]]
+        created_at = _format_timestamp(row[4])
+        updated_at = _format_timestamp(row[5])
+
+        width_id = max(width_id, len(id))
+        width_title = max(width_title, len(title))
+        width_priority = max(width_priority, len(priority))
+        width_status = max(width_status, len(status))
+        width_created_at = max(width_created_at, len(created_at))
+        width_updated_at = max(width_updated_at, len(updated_at))
+
+        cells.append((id, title, priority, status, created_at, updated_at))
+
+    horizontal = [
+        "─" * (width + 2)
+        for width in (
+            width_id,
+            width_title,
+            width_priority,
+            width_status,
+            width_created_at,
+            width_updated_at,
+        )
+    ]
+    # `str.format` pads every cell in a single call. (The ID is centered
+    # separately because `str.center` splits odd padding differently.)
+    format_row = (
+        f"│ {{}} │ {{:<{width_title}}} │ {{:<{width_priority}}} │ "
+        f"{{:<{width_status}}} │ {{:<{width_created_at}}} │ "
+        f"{{:<{width_updated_at}}} │"
+    ).format
 
     lines = [
-        # Line 1
-        "┌"
-        + "─" * (width_id + 2)
-        + "┬"
-        + "─" * (width_title + 2)
-        + "┬"
-        + "─" * (width_priority + 2)
-        + "┬"
-        + "─" * (width_status + 2)
-        + "┬"
-        + "─" * (width_created_at + 2)
-        + "┬"
-        + "─" * (width_updated_at + 2)
-        + "┐",
-        # Line 2
-        "│ "
-        + "ID".center(width_id)
-        + " │ "
-        + "Title".ljust(width_title)
-        + " │ "
-        + "Priority".ljust(width_priority)
-        + " │ "
-        + "Status".ljust(width_status)
-        + " │ "
-        + "Created at".ljust(width_created_at)
-        + " │ "
-        + "Updated at".ljust(width_updated_at)
-        + " │",
-        # Line 3
-        "├"
-        + "─" * (width_id + 2)
-        + "┼"
-        + "─" * (width_title + 2)
-        + "┼"
-        + "─" * (width_priority + 2)
-        + "┼"
-        + "─" * (width_status + 2)
-        + "┼"
-        + "─" * (width_created_at + 2)
-        + "┼"
-        + "─" * (width_updated_at + 2)
-        + "┤",
+        "┌" + "┬".join(horizontal) + "┐",
+        format_row(
+            "ID".center(width_id),
+            "Title",
+            "Priority",
+            "Status",
+            "Created at",
+            "Updated at",
+        ),
+        "├" + "┼".join(horizontal) + "┤",
     ]
+    lines.extend(format_row(id.center(width_id), *rest) for id, *rest in cells)
+    lines.append("└" + "┴".join(horizontal) + "┘\n")
 
-    for task in tasks:
-        created_at = task.created_at.strftime("%Y-%m-%dT%H:%M:%S%z")
-        updated_at = task.updated_at.strftime("%Y-%m-%dT%H:%M:%S%z")
-
-        lines.append(
-            "│ "
-            + str(task.id).center(width_id)
-            + " │ "
-            + task.title.ljust(width_title)
-            + " │ "
-            + task.priority.name.ljust(width_priority)
-            + " │ "
-            + task.status.name.ljust(width_status)
-            + " │ "
-            + created_at.ljust(width_created_at)
-            + " │ "
-            + updated_at.ljust(width_updated_at)
-            + " │"
-        )
-
-    lines.append(
-        "└"
-        + "─" * (width_id + 2)
-        + "┴"
-        + "─" * (width_title + 2)
-        + "┴"
-        + "─" * (width_priority + 2)
-        + "┴"
-        + "─" * (width_status + 2)
-        + "┴"
-        + "─" * (width_created_at + 2)
-        + "┴"
-        + "─" * (width_updated_at + 2)
-        + "┘",
-    )
-
-    return lines
+    return "\n".join(lines)
@@ -1,15 +1,19 @@
-import argparse
+from __future__ import annotations
+
 import dataclasses
 import logging
-from typing import Self
+from typing import TYPE_CHECKING, Self, Sequence
 
 from ..context import Context
-from ..subcommand import Subcommand
+from ..subcommand import Subcommand, split_argv
+
+if TYPE_CHECKING:
+    import argparse
 
 log = logging.getLogger(__name__)
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Reopen(Subcommand):
     """Mark a task as incomplete."""
 
@@ -21,12 +25,19 @@ class Reopen(Subcommand):
             id=args.id,
         )
 
+    @classmethod
+    def parse_argv(cls, argv: Sequence[str], /) -> Self:
+        _, (task_id,) = split_argv(argv)
+        return cls(
+            id=int(task_id),
+        )
+
     @classmethod
     def add_arguments(cls, parser: argparse.ArgumentParser, /) -> None:
         parser.add_argument(
             "id",
             action="store",
-            type=str,
+            type=int,
             help="Unique identifier for the task",
         )
 
@@ -2,11 +2,16 @@
 This module implements a dataclass for passing around data between subcommands.
 """
 
+from __future__ import annotations
+
 import dataclasses
-import sqlite3
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import sqlite3
 
 
-@dataclasses.dataclass
+@dataclasses.dataclass(slots=True)
 class Context:
     """A type for passing around relevant data and state information.
 
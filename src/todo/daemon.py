@@ -0,0 +1,264 @@
+"""
+This module implements a long-running process that keeps the database open.
+
+Normally, every invocation opens the database, runs a single statement and
+exits. While `todo daemon` is running, other invocations forward their
+arguments to it over a Unix socket instead, so they reuse its connection
+(and SQLite's page cache) rather than setting up a new one each time.
+
+Messages are JSON objects, prefixed by their length in bytes as a 4-byte
+big-endian unsigned integer.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import logging
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Sequence
+
+from .args import parse_args
+
+if TYPE_CHECKING:
+    import socket
+
+    from .context import Context
+
+log = logging.getLogger(__name__)
+
+# `__main__` imports this module on every invocation, so anything only
+# needed to talk to the daemon (e.g., `json`) is imported where it is used.
+_HEADER_SIZE = 4
+
+# How long the daemon waits for a client to send its request. Clients send
+# it immediately after connecting, so this only has to be long enough to
+# drop connections that would otherwise block everyone else.
+_SERVER_TIMEOUT = 1.0
+# How long a client waits on the daemon to respond before giving up.
+_CLIENT_TIMEOUT = 10.0
+
+
+def socket_path() -> str | None:
+    """Get the location of the daemon's socket.
+
+    Returns
+    -------
+    str
+        The path to the socket (which may or may not exist).
+    None
+        The daemon is not supported on this system.
+    """
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+
+    if not runtime_dir or sys.platform == "win32":
+        return None
+
+    return os.path.join(runtime_dir, "todo.sock")
+
+
+def send_message(sock: socket.socket, message: dict[str, Any]) -> None:
+    """Write a length-prefixed JSON message to the socket."""
+    import json
+
+    data = json.dumps(message).encode("utf-8")
+    sock.sendall(len(data).to_bytes(_HEADER_SIZE, "big") + data)
+
+
+def recv_message(sock: socket.socket) -> dict[str, Any]:
+    """Read a length-prefixed JSON message from the socket.
+
+    Raises
+    ------
+    ConnectionError
+        The socket was closed before the whole message was received.
+    """
+    import json
+
+    size = int.from_bytes(_recv_exactly(sock, _HEADER_SIZE), "big")
+    message: dict[str, Any] = json.loads(_recv_exactly(sock, size))
+    return message
+
+
+def _recv_exactly(sock: socket.socket, size: int) -> bytes:
+    buffer = bytearray()
+
+    while len(buffer) < size:
+        if not (chunk := sock.recv(size - len(buffer))):
+            raise ConnectionError("connection closed by peer")
+
+        buffer += chunk
+
+    return bytes(buffer)
+
+
+def request(path: str, argv: Sequence[str]) -> dict[str, Any] | None:
+    """Ask the daemon to run a command on our behalf.
+
+    Parameters
+    ----------
+    path
+        The location of the daemon's socket (see [`socket_path`]).
+    argv
+        Command-line arguments.
+
+    Returns
+    -------
+    dict[str, Any]
+        The daemon's response, which contains the `stdout` and `stderr`
+        output of the command, and its exit `status`. If the request was
+        sent but no response arrived, this describes the failure instead.
+    None
+        The daemon is not running, so the request was never sent.
+    """
+    if not os.path.exists(path):
+        return None
+
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(_CLIENT_TIMEOUT)
+
+        try:
+            sock.connect(path)
+            send_message(sock, {"argv": list(argv)})
+        except OSError as exc:
+            # e.g., the daemon exited without cleaning up after itself.
+            log.debug("failed to reach the daemon: %s", exc)
+            return None
+
+        try:
+            return recv_message(sock)
+        except OSError as exc:
+            # Includes timeouts, and the daemon exiting mid-request. Either
+            # way, the command may already have run, so it must not be run
+            # again by the caller.
+            log.warning("no response from the daemon: %s", exc)
+            return {
+                "stdout": "",
+                "stderr": (
+                    f"error: no response from the daemon ({exc}); "
+                    "the command may or may not have run\n"
+                ),
+                "status": 1,
+            }
+
+
+def dispatch(ctx: Context, argv: Sequence[str]) -> dict[str, Any]:
+    """Run a command, capturing its output.
+
+    Parameters
+    ----------
+    ctx
+        Context type containing relevant data and state information.
+    argv
+        Command-line arguments.
+
+    Returns
+    -------
+    dict[str, Any]
+        The response to send back to the client (see [`request`]).
+    """
+    stdout = io.StringIO()
+    stderr = io.StringIO()
+    status = 0
+
+    with (
+        contextlib.redirect_stdout(stdout),
+        contextlib.redirect_stderr(stderr),
+    ):
+        try:
+            args = parse_args(argv)
+
+            if args.subcommand == "daemon":
+                raise RuntimeError("the daemon is already running")
+
+            args.command.run(ctx)
+        except SystemExit as exc:
+            # Raised by `argparse` for `--help` and invalid arguments.
+            status = exc.code if isinstance(exc.code, int) else 1
+        except Exception as exc:
+            log.exception("failed to run command: %r", argv)
+            _ = sys.stderr.write(f"error: {exc}\n")
+            status = 1
+
+    return {
+        "stdout": stdout.getvalue(),
+        "stderr": stderr.getvalue(),
+        "status": status,
+    }
+
+
+def _is_listening(path: str) -> bool:
+    import socket
+
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(path)
+        except OSError:
+            return False
+
+    return True
+
+
+def serve(path: str, ctx: Context) -> None:
+    """Handle requests from other invocations until interrupted.
+
+    Requests are handled one at a time, since they all share the same
+    database connection.
+
+    Parameters
+    ----------
+    path
+        Where to create the socket (see [`socket_path`]).
+    ctx
+        Context type containing relevant data and state information.
+
+    Raises
+    ------
+    RuntimeError
+        Another daemon is already listening on `path`.
+    """
+    import signal
+    import socketserver
+
+    if _is_listening(path):
+        raise RuntimeError(f"the daemon is already running: {path}")
+
+    with contextlib.suppress(FileNotFoundError):
+        os.unlink(path)
+
+    class Handler(socketserver.BaseRequestHandler):
+        def handle(self) -> None:
+            self.request.settimeout(_SERVER_TIMEOUT)
+
+            try:
+                message = recv_message(self.request)
+            except OSError as exc:
+                # e.g., another daemon checking whether we're running, or a
+                # client that never sent its request.
+                log.debug("dropped connection: %s", exc)
+                return
+
+            log.debug("received request: %r", message)
+            response = dispatch(ctx, message["argv"])
+
+            try:
+                send_message(self.request, response)
+            except OSError as exc:
+                log.warning("failed to send response: %s", exc)
+
+    # Shut down cleanly (i.e., remove the socket) when asked to terminate.
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    with socketserver.UnixStreamServer(path, Handler) as server:
+        os.chmod(path, 0o600)
+        log.info("listening on %s", path)
+
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            os.unlink(path)
@@ -0,0 +1,25 @@
+"""
+This module serializes command output as JSON.
+
+[`orjson`](https://github.com/ijl/orjson) is used when it is installed
+(e.g., `pip install todo[fast]`), since it is considerably faster than the
+standard library. Otherwise, this falls back to [`json`][json]. Both produce
+the same output.
+"""
+
+from typing import Any
+
+try:
+    import orjson
+except ImportError:
+    import json
+
+    def dumps(obj: Any, /) -> str:
+        """Serialize `obj` as JSON, indented by two spaces."""
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+else:
+
+    def dumps(obj: Any, /) -> str:
+        """Serialize `obj` as JSON, indented by two spaces."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
@@ -2,6 +2,8 @@
 This module provides utility functions for configuring the logger.
 """
 
+import atexit
+import functools
 import logging
 from typing import Iterable
 
@@ -14,6 +16,10 @@ def setup_logger(
 
     This function should only be called once at the start of the program.
 
+    For levels that produce a lot of output (i.e., [`logging.INFO`] and
+    below), events are passed to `handlers` on a background thread so that
+    writing them out does not hold up the rest of the program.
+
     Parameters
     ----------
     level
@@ -27,13 +33,36 @@ def setup_logger(
         style="%",
     )
 
+    handlers = tuple(handlers)
+
     for handler in handlers:
         handler.setFormatter(fmt=formatter)
-        logging.root.addHandler(hdlr=handler)
+
+    if level > logging.INFO:
+        # Only warnings and errors are expected here, which is not worth the
+        # cost of importing `logging.handlers` and starting a thread.
+        for handler in handlers:
+            logging.root.addHandler(hdlr=handler)
+    else:
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+
+        records: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        listener = QueueListener(
+            records,
+            *handlers,
+            respect_handler_level=True,
+        )
+        listener.start()
+        # Make sure every event is handled before the program exits.
+        atexit.register(listener.stop)
+
+        logging.root.addHandler(hdlr=QueueHandler(records))
 
     logging.root.setLevel(level=level)
 
 
+@functools.lru_cache(maxsize=16)
 def level_from_directive(directive: str) -> int | None:
     """Convert a string level into a valid logging level.
 
@@ -0,0 +1,169 @@
+"""
+This module provides utility functions for reading the project's metadata
+from its `pyproject.toml` file.
+"""
+
+import functools
+import os
+import pathlib
+import re
+from typing import Any, Mapping, MutableMapping
+
+# Parsed files, keyed by their path and modification time so that an edited
+# file is read again.
+_PARSED_CACHE: dict[tuple[str, int], Mapping[str, Any]] = {}
+
+# Used to read `project.name` and `project.version` without parsing the whole
+# file. Only simple, single-line strings are matched; anything else (e.g.,
+# escape sequences or dotted keys) is left to `tomllib`.
+_PROJECT_TABLE = re.compile(rb"^\[project\][ \t]*(?:#.*)?$", re.MULTILINE)
+_NEXT_TABLE = re.compile(rb"^[ \t]*\[", re.MULTILINE)
+_NAME_OR_VERSION = re.compile(
+    rb'^[ \t]*(name|version)[ \t]*=[ \t]*"([^"\\\n]*)"[ \t]*(?:#.*)?$',
+    re.MULTILINE,
+)
+
+
+def find_pyproject(start: pathlib.Path | None = None) -> pathlib.Path:
+    """Search for `pyproject.toml` in a directory and each of its parents.
+
+    The search stops at the root of a Git repository (i.e., a directory that
+    contains `.git`), since a project does not extend beyond it.
+
+    Parameters
+    ----------
+    start
+        The directory to start searching from. Defaults to the current
+        working directory.
+
+    Returns
+    -------
+    pathlib.Path
+        The location of the closest `pyproject.toml` file.
+
+    Raises
+    ------
+    FileNotFoundError
+        None of the directories searched contain a `pyproject.toml` file.
+    """
+    # The search itself works on strings; the only `Path` is the result.
+    directory = os.getcwd() if start is None else os.path.realpath(start)
+    return pathlib.Path(_find_pyproject(directory))
+
+
+@functools.lru_cache(maxsize=32)
+def _find_pyproject(start: str) -> str:
+    directory = start
+
+    while True:
+        is_repository_root = False
+
+        # Listing the directory once answers both questions, without a
+        # separate `stat` call for each.
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name == "pyproject.toml" and entry.is_file():
+                        return entry.path
+                    elif entry.name == ".git":
+                        # May also be a file (e.g., in a worktree).
+                        is_repository_root = True
+        except PermissionError:
+            # Listing a directory requires read permission, but looking up
+            # an entry by name only requires search permission (e.g., a home
+            # directory with mode 0711).
+            candidate = os.path.join(directory, "pyproject.toml")
+
+            if os.path.isfile(candidate):
+                return candidate
+
+            git = os.path.join(directory, ".git")
+            is_repository_root = os.path.lexists(git)
+
+        parent = os.path.dirname(directory)
+
+        if is_repository_root or parent == directory:
+            raise FileNotFoundError(f"pyproject.toml not found: {start}")
+
+        directory = parent
+
+
+def pyproject_init(start: pathlib.Path | None = None) -> None:
+    """Expose the project's metadata through environment variables.
+
+    Parameters
+    ----------
+    start
+        The directory to start searching from (see [`find_pyproject`]).
+
+    Raises
+    ------
+    FileNotFoundError
+        The `pyproject.toml` file could not be found.
+    """
+    path = find_pyproject(start)
+    key = (str(path), os.stat(path).st_mtime_ns)
+
+    if (data := _PARSED_CACHE.get(key)) is None:
+        buffer = path.read_bytes()
+
+        if (fields := _fast_name_version(buffer)) is not None:
+            name, version = fields
+            data = {"project": {"name": name, "version": version}}
+        else:
+            # Only needed when the fast path fails, and slow to import.
+            import tomllib
+
+            data = tomllib.loads(buffer.decode("utf-8"))
+
+        _PARSED_CACHE[key] = data
+
+    pyproject_update_env(data, os.environ)
+
+
+def _fast_name_version(buffer: bytes) -> tuple[str, str] | None:
+    if (table := _PROJECT_TABLE.search(buffer)) is None:
+        return None
+
+    end = _NEXT_TABLE.search(buffer, table.end())
+    region = buffer[table.end() : len(buffer) if end is None else end.start()]
+
+    # A multi-line string could contain lines that look like keys, and
+    # duplicate keys are an error; `tomllib` handles both correctly.
+    if b'"""' in region or b"'''" in region:
+        return None
+
+    found = _NAME_OR_VERSION.findall(region)
+    fields = dict(found)
+
+    if len(fields) != len(found):
+        return None
+
+    try:
+        return fields[b"name"].decode("utf-8"), fields[b"version"].decode(
+            "utf-8"
+        )
+    except (KeyError, UnicodeDecodeError):
+        return None
+
+
+def pyproject_update_env(
+    data: Mapping[str, Any],
+    env: MutableMapping[str, str],
+) -> None:
+    """Copy the project's name and version into `env`.
+
+    Parameters
+    ----------
+    data
+        The parsed contents of a `pyproject.toml` file.
+    env
+        Where to store the variables (e.g., [`os.environ`][os.environ]).
+    """
+    project = data.get("project", {})
+
+    if (name := project.get("name")) is not None:
+        env["PYPROJECT_NAME"] = str(name)
+
+    if (version := project.get("version")) is not None:
+        env["PYPROJECT_VERSION"] = str(version)
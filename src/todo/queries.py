@@ -0,0 +1,37 @@
+"""
+This module defines the SQL statements shared between subcommands.
+
+`sqlite3` keeps a per-connection cache of compiled statements keyed by their
+text, so statements should be defined once here and bound with parameters,
+rather than built from strings at the call site.
+"""
+
+# Applied to every new connection; see https://sqlite.org/pragma.html.
+PRAGMAS = (
+    "PRAGMA journal_mode = WAL;",
+    "PRAGMA synchronous = NORMAL;",
+    "PRAGMA temp_store = MEMORY;",
+    "PRAGMA mmap_size = 268435456;",
+    "PRAGMA cache_size = -20000;",
+)
+
+INSERT_TASK = """
+INSERT INTO task(title, priority, status)
+VALUES(?, ?, ?)
+RETURNING id, title, priority, status, created_at, updated_at;
+"""
+
+UPDATE_TASK_STATUS = """
+UPDATE task
+SET
+    status = ?,
+    updated_at = ?
+WHERE id = ?
+RETURNING id, title, priority, status, created_at, updated_at;
+"""
+
+DELETE_TASK_BY_ID = """
+DELETE FROM task
+WHERE id = ?
+RETURNING id, title, priority, status, created_at, updated_at;
+"""
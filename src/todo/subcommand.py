@@ -1,36 +1,118 @@
 from __future__ import annotations
 
 import abc
-import argparse
-import string
-from typing import TYPE_CHECKING
+import re
+import sys
+import types
+from typing import TYPE_CHECKING, ClassVar, Collection, Mapping, Sequence
 
 from .context import Context
 
 if TYPE_CHECKING:
+    import argparse
+
     SubParsersAction = argparse._SubParsersAction[argparse.ArgumentParser]
 
-subcommand_registry: dict[str, type[Subcommand]] = {}
+_registry: dict[str, tuple[type[Subcommand], argparse.ArgumentParser]] = {}
 
+# A read-only view of the subcommands added by `Subcommand.register`.
+subcommand_registry: Mapping[
+    str, tuple[type[Subcommand], argparse.ArgumentParser]
+] = types.MappingProxyType(_registry)
 
-def _camel_case_to_kebab_case(name: str) -> str:
-    if len(name) < 1:
-        return name
 
-    # The first character in CamelCase is always uppercase. We do it outside
-    # of the loop to avoid having to clean up the string afterwards.
-    kebab_case = name[0].lower()
+_UPPERCASE_PATTERN = re.compile(r"[A-Z]")
 
-    for c in name[1:]:
-        if c in string.ascii_uppercase:
-            kebab_case += "-" + c.lower()
+
+def _camel_case_to_kebab_case(name: str) -> str:
+    # The first character in CamelCase is always uppercase. We do it outside
+    # of the substitution to avoid having to clean up the string afterwards.
+    return name[:1].lower() + _UPPERCASE_PATTERN.sub(
+        lambda match: "-" + match.group(0).lower(), name[1:]
+    )
+
+
+def split_argv(
+    argv: Sequence[str],
+    /,
+    *,
+    options: Collection[str] = (),
+    flags: Collection[str] = (),
+) -> tuple[dict[str, str], list[str]]:
+    """Separate options from positional arguments in a single pass.
+
+    Only the common forms are recognized: `--name value`, `--name=value`,
+    `--flag` and `--` to mark the end of options. Anything else should be
+    handled by [`argparse`][argparse] instead.
+
+    Parameters
+    ----------
+    argv
+        Command-line arguments that follow the subcommand's name.
+    options
+        Names of the options that expect a value (e.g., `--priority`).
+    flags
+        Names of the options that do not expect a value (e.g., `--all`).
+
+    Returns
+    -------
+    tuple[dict[str, str], list[str]]
+        The options that were found, and the remaining positional arguments.
+        Flags are mapped to an empty string; test for them using `in`.
+
+    Raises
+    ------
+    ValueError
+        An unrecognized or incomplete option was found.
+    """
+    found: dict[str, str] = {}
+    positionals: list[str] = []
+    it = iter(argv)
+
+    for arg in it:
+        if arg == "--":
+            positionals.extend(it)
+            break
+        elif arg[:2] == "--":
+            name, sep, value = arg.partition("=")
+
+            if name in options:
+                if not sep:
+                    try:
+                        value = next(it)
+                    except StopIteration:
+                        msg = f"expected one argument: {name}"
+                        raise ValueError(msg) from None
+
+                found[name] = value
+            elif name in flags and not sep:
+                found[name] = ""
+            else:
+                raise ValueError(f"unrecognized argument: {arg}")
+        elif arg[:1] == "-" and arg != "-":
+            raise ValueError(f"unrecognized argument: {arg}")
         else:
-            kebab_case += c
+            positionals.append(arg)
 
-    return kebab_case
+    return found, positionals
 
 
 class Subcommand(abc.ABC):
+    # Lets subclasses declared with `dataclass(slots=True)` omit `__dict__`.
+    __slots__ = ()
+
+    # Derived from the subclass once, when it is defined (see `register`).
+    _kebab_name: ClassVar[str]
+    _short_doc: ClassVar[str]
+    # Whether `add_arguments` was called for the latest registered parser.
+    _args_added: ClassVar[bool]
+
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._kebab_name = sys.intern(_camel_case_to_kebab_case(cls.__name__))
+        cls._short_doc = (cls.__doc__ or "").partition("\n\n")[0]
+        cls._args_added = False
+
     @classmethod
     @abc.abstractmethod
     def from_args(cls, args: argparse.Namespace) -> Subcommand:
@@ -49,12 +131,41 @@ class Subcommand(abc.ABC):
         """
         pass
 
+    @classmethod
+    @abc.abstractmethod
+    def parse_argv(cls, argv: Sequence[str], /) -> Subcommand:
+        """Construct this type directly from command-line arguments.
+
+        This is the fast path taken on every invocation; it should accept
+        the same arguments as [`Subcommand.add_arguments`] defines, walking
+        `argv` only once (see [`split_argv`]).
+
+        Parameters
+        ----------
+        argv
+            Command-line arguments that follow the subcommand's name.
+
+        Returns
+        -------
+        Subcommand
+            An instance of the current type.
+
+        Raises
+        ------
+        ValueError
+            The arguments are invalid or not understood. The caller is
+            expected to fall back to [`argparse`][argparse], which reports
+            the error to the user.
+        """
+        pass
+
     @classmethod
     def register(cls, parent: SubParsersAction) -> argparse.ArgumentParser:
         """Create a new parser for this subcommand.
 
         By default, the subcommand's name is the class name converted from
-        CamelCase to kebab-case.
+        CamelCase to kebab-case. The parser starts out without any of the
+        subcommand's arguments; see [`Subcommand.materialize`].
 
         Parameters
         ----------
@@ -66,14 +177,44 @@ class Subcommand(abc.ABC):
         argparse.ArgumentParser
             The newly created parser.
         """
-        name = _camel_case_to_kebab_case(cls.__name__)
+        name = cls._kebab_name
         parser = parent.add_parser(
             name=name,
             deprecated=False,
-            help=(cls.__doc__ or "").split("\n\n", maxsplit=1)[0],
+            help=cls._short_doc,
         )
-        subcommand_registry[name] = cls
-        cls.add_arguments(parser)
+        _registry[name] = (cls, parser)
+        cls._args_added = False
+        return parser
+
+    @staticmethod
+    def materialize(name: str) -> argparse.ArgumentParser:
+        """Define the options and arguments for a registered subcommand.
+
+        Only one subcommand is used per invocation, so the others never need
+        their arguments defined. This method is safe to call more than once.
+
+        Parameters
+        ----------
+        name
+            The name the subcommand was registered with.
+
+        Returns
+        -------
+        argparse.ArgumentParser
+            The parser that represents the subcommand in the CLI.
+
+        Raises
+        ------
+        KeyError
+            There is no subcommand registered with the given name.
+        """
+        cls, parser = subcommand_registry[name]
+
+        if not cls._args_added:
+            cls.add_arguments(parser)
+            cls._args_added = True
+
         return parser
 
     @classmethod
@@ -82,8 +223,8 @@ class Subcommand(abc.ABC):
 
         By default, this method has an empty implementation. Override this
         method to define the options and arguments needed to implement
-        [`Subcommand.from_args`]. This method is automatically called at
-        the end of [`Subcommand.register`].
+        [`Subcommand.from_args`]. This method is automatically called by
+        [`Subcommand.materialize`].
 
         Parameters
         ----------
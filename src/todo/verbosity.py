@@ -4,6 +4,7 @@ This module converts command-line arguments to logging levels.
 
 import enum
 import logging
+from typing import Final
 
 
 class Verbosity(enum.IntEnum):
@@ -43,51 +44,45 @@ class Verbosity(enum.IntEnum):
         ValueError
             Either `verbose` or `quiet` are less than 0.
         """
-        match quiet:
-            case n if n < 0:
-                raise ValueError(f"expected value greater than 0, got {n}")
-            case 0:
-                pass
-            case 1:
-                return cls.QUIET
-            case _:
-                return cls.SILENT
-
-        match verbose:
-            case n if n < 0:
-                raise ValueError(f"expected value greater than 0, got {n}")
-            case 0:
-                return cls.DEFAULT
-            case 1:
-                return cls.VERBOSE
-            case _:
-                return cls.EXTRA_VERBOSE
+        if quiet < 0:
+            raise ValueError(f"expected value greater than 0, got {quiet}")
+        elif quiet > 0:
+            return _BY_QUIET[min(quiet, len(_BY_QUIET)) - 1]
+
+        if verbose < 0:
+            raise ValueError(f"expected value greater than 0, got {verbose}")
+
+        return _BY_VERBOSE[min(verbose, len(_BY_VERBOSE) - 1)]
 
     def to_level(self) -> int | None:
         """Convert the verbosity level into a logging level."""
-        match self:
-            case self.SILENT:
-                return None
-            case self.QUIET:
-                return logging.ERROR
-            case self.DEFAULT:
-                return logging.WARNING
-            case self.VERBOSE:
-                return logging.INFO
-            case self.EXTRA_VERBOSE:
-                return logging.DEBUG
-            case level:
-                raise NotImplementedError(f"unexpected level: {level}")
+        return _LEVELS[self]
 
     def to_level_name(self) -> str | None:
         """Convert the verbosity level into a logging level."""
-        level = self.to_level()
+        return _LEVEL_NAMES[self]
+
 
-        if level is None:
-            return None
+# Indexed by the number of times `--quiet` (minus one) or `--verbose` was used,
+# capped at the last item.
+_BY_QUIET: Final = (Verbosity.QUIET, Verbosity.SILENT)
+_BY_VERBOSE: Final = (
+    Verbosity.DEFAULT,
+    Verbosity.VERBOSE,
+    Verbosity.EXTRA_VERBOSE,
+)
 
-        level_name = logging.getLevelName(level)
-        # The verbosity levels should map to the levels in logging.
-        assert isinstance(level_name, str), repr(level_name)
+_LEVELS: Final[dict[Verbosity, int | None]] = {
+    Verbosity.SILENT: None,
+    Verbosity.QUIET: logging.ERROR,
+    Verbosity.DEFAULT: logging.WARNING,
+    Verbosity.VERBOSE: logging.INFO,
+    Verbosity.EXTRA_VERBOSE: logging.DEBUG,
+}
 
-        return level_name
+# The verbosity levels should map to the levels in `logging`, which always
+# have a name.
+_LEVEL_NAMES: Final[dict[Verbosity, str | None]] = {
+    verbosity: None if level is None else logging.getLevelName(level)
+    for verbosity, level in _LEVELS.items()
+}
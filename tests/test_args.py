@@ -0,0 +1,85 @@
+import contextlib
+import io
+import unittest
+
+from todo.args import parse_args
+from todo.commands.add import Add
+from todo.commands.complete import Complete
+from todo.commands.delete import Delete
+from todo.commands.list import List, SortBy
+from todo.subcommand import split_argv
+from todo.task import Priority, Status
+
+
+class TestSplitArgv(unittest.TestCase):
+    def test_options_and_positionals(self) -> None:
+        options, positionals = split_argv(
+            ["a", "--priority", "HIGH", "--status=ACTIVE", "--all", "b"],
+            options=("--priority", "--status"),
+            flags=("--all",),
+        )
+
+        self.assertEqual(
+            options,
+            {"--priority": "HIGH", "--status": "ACTIVE", "--all": ""},
+        )
+        self.assertEqual(positionals, ["a", "b"])
+
+    def test_end_of_options(self) -> None:
+        _, positionals = split_argv(["--", "--all", "-v"], flags=("--all",))
+        self.assertEqual(positionals, ["--all", "-v"])
+
+    def test_invalid(self) -> None:
+        for argv in (["--unknown"], ["-x"], ["--priority"], ["--all=1"]):
+            with self.subTest(argv=argv), self.assertRaises(ValueError):
+                split_argv(argv, options=("--priority",), flags=("--all",))
+
+
+class TestParseArgs(unittest.TestCase):
+    def test_verbosity(self) -> None:
+        args = parse_args(["-vv", "--quiet", "-q", "list"])
+        self.assertEqual((args.verbose, args.quiet), (2, 2))
+
+    def test_add(self) -> None:
+        args = parse_args(["add", "Buy milk", "--priority=HIGH"])
+        self.assertEqual(args.subcommand, "add")
+        self.assertEqual(
+            args.command,
+            Add(
+                title="Buy milk", priority=Priority.HIGH, status=Status.PENDING
+            ),
+        )
+
+    def test_list(self) -> None:
+        args = parse_args(["list", "--sort-by", "created_at", "--all"])
+        self.assertEqual(
+            args.command,
+            List(
+                sort_by=SortBy.CREATED_AT,
+                reverse=False,
+                as_json=False,
+                show_all=True,
+            ),
+        )
+
+    def test_fallback(self) -> None:
+        # Negative numbers are not understood by the fast path.
+        for name, cls in (("delete", Delete), ("complete", Complete)):
+            with self.subTest(name=name):
+                args = parse_args([name, "-1"])
+                self.assertEqual(args.command, cls(id=-1))
+
+    def test_invalid(self) -> None:
+        for argv in (
+            [],
+            ["unknown"],
+            ["add"],
+            ["add", "x", "--priority=1"],
+            ["complete", "abc"],
+        ):
+            with (
+                self.subTest(argv=argv),
+                contextlib.redirect_stderr(io.StringIO()),
+                self.assertRaises(SystemExit),
+            ):
+                parse_args(argv)
@@ -0,0 +1,107 @@
+import contextlib
+import io
+import json
+import pathlib
+import sqlite3
+import unittest
+
+from todo.commands.add import Add
+from todo.commands.complete import Complete
+from todo.commands.delete import Delete
+from todo.context import Context
+from todo.subcommand import Subcommand
+from todo.task import Priority, Status
+
+_MIGRATIONS = pathlib.Path(__file__).parent.parent / "migrations"
+
+
+class TestWriteCommands(unittest.TestCase):
+    def setUp(self) -> None:
+        connection = sqlite3.connect(":memory:")
+        self.addCleanup(connection.close)
+
+        for path in sorted(_MIGRATIONS.glob("*.sql")):
+            connection.executescript(path.read_text("utf-8"))
+
+        self.ctx = Context(connection)
+
+    def run_command(self, command: Subcommand) -> tuple[str, str]:
+        stdout = io.StringIO()
+        stderr = io.StringIO()
+
+        with (
+            contextlib.redirect_stdout(stdout),
+            contextlib.redirect_stderr(stderr),
+        ):
+            command.run(self.ctx)
+
+        return stdout.getvalue(), stderr.getvalue()
+
+    def rows(self) -> list[tuple[int, str, int, int]]:
+        cursor = self.ctx.connection.execute(
+            "SELECT id, title, priority, status FROM task ORDER BY id"
+        )
+        return cursor.fetchall()
+
+    def add(self, title: str) -> dict[str, object]:
+        stdout, _ = self.run_command(
+            Add(title=title, priority=Priority.HIGH, status=Status.PENDING)
+        )
+        task: dict[str, object] = json.loads(stdout)
+        return task
+
+    def test_add(self) -> None:
+        stdout, stderr = self.run_command(
+            Add(title="Buy milk", priority=Priority.HIGH, status=Status.ACTIVE)
+        )
+        task = json.loads(stdout)
+
+        self.assertEqual(stderr, "Task created successfully!\n\n")
+        self.assertEqual(task["id"], 1)
+        self.assertEqual(task["title"], "Buy milk")
+        self.assertEqual(task["priority"], "HIGH")
+        self.assertEqual(task["status"], "ACTIVE")
+        self.assertEqual(task["updated_at"], task["created_at"])
+        self.assertEqual(self.rows(), [(1, "Buy milk", 2, 1)])
+
+    def test_complete(self) -> None:
+        self.add("Buy milk")
+        self.add("Walk the dog")
+
+        stdout, stderr = self.run_command(Complete(id=2))
+        task = json.loads(stdout)
+
+        self.assertEqual(stderr, "Completed task with ID 2\n\n")
+        self.assertEqual(task["id"], 2)
+        self.assertEqual(task["status"], "COMPLETED")
+        self.assertEqual(
+            self.rows(), [(1, "Buy milk", 2, 0), (2, "Walk the dog", 2, 2)]
+        )
+
+    def test_complete_missing(self) -> None:
+        self.add("Buy milk")
+
+        stdout, stderr = self.run_command(Complete(id=99))
+
+        self.assertEqual(stdout, "")
+        self.assertEqual(stderr, "No task with ID 99 found\n")
+        self.assertEqual(self.rows(), [(1, "Buy milk", 2, 0)])
+
+    def test_delete(self) -> None:
+        added = self.add("Buy milk")
+        self.add("Walk the dog")
+
+        stdout, stderr = self.run_command(Delete(id=1))
+
+        self.assertEqual(stderr, "Deleted task with ID 1\n\n")
+        self.assertEqual(json.loads(stdout), added)
+        self.assertEqual(self.rows(), [(2, "Walk the dog", 2, 0)])
+
+    def test_delete_missing(self) -> None:
+        self.add("Buy milk")
+
+        stdout, stderr = self.run_command(Delete(id=99))
+
+        self.assertEqual(stdout, "")
+        self.assertEqual(stderr, "No task with ID 99 found\n")
+        self.assertEqual(self.rows(), [(1, "Buy milk", 2, 0)])
@@ -0,0 +1,201 @@
+import contextlib
+import io
+import os
+import socket
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from typing import Callable
+from unittest import mock
+
+from todo.__main__ import ExitCode, main
+from todo.context import Context
+from todo.daemon import dispatch, recv_message, request, send_message
+
+
+class TestDaemon(unittest.TestCase):
+    def test_message_roundtrip(self) -> None:
+        message = {"argv": ["add", "Ünïcode", "--priority", "HIGH"]}
+        a, b = socket.socketpair()
+
+        with a, b:
+            send_message(a, message)
+            self.assertEqual(recv_message(b), message)
+
+    def test_recv_message_closed(self) -> None:
+        a, b = socket.socketpair()
+
+        with b:
+            a.close()
+
+            with self.assertRaises(ConnectionError):
+                recv_message(b)
+
+    def test_dispatch_captures_output(self) -> None:
+        ctx = Context(sqlite3.connect(":memory:"))
+        response = dispatch(ctx, ["add", "--help"])
+
+        self.assertEqual(response["status"], 0)
+        self.assertIn("usage:", response["stdout"])
+        self.assertEqual(response["stderr"], "")
+
+    def test_requires_runtime_dir(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        env = os.environ.copy()
+        env.pop("XDG_RUNTIME_DIR", None)
+        stderr = io.StringIO()
+
+        with (
+            mock.patch.dict(os.environ, env, clear=True),
+            mock.patch("todo.__main__._DATA_DIR", directory.name),
+            mock.patch(
+                "todo.__main__._DATABASE",
+                os.path.join(directory.name, "todo.db"),
+            ),
+            mock.patch("todo.__main__.setup_logger"),
+            contextlib.redirect_stderr(stderr),
+        ):
+            status = main(["daemon"])
+
+        self.assertEqual(status, ExitCode.FAILURE)
+        self.assertIn("requires XDG_RUNTIME_DIR", stderr.getvalue())
+
+    def test_dispatch_error(self) -> None:
+        ctx = Context(sqlite3.connect(":memory:"))
+        response = dispatch(ctx, ["list"])  # The table doesn't exist.
+
+        self.assertEqual(response["status"], 1)
+        self.assertIn("no such table", response["stderr"])
+
+
+class TestRequest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "todo.sock")
+
+    def listen(self, handle: Callable[[socket.socket], object]) -> None:
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.addCleanup(server.close)
+        server.bind(self.path)
+        server.listen()
+
+        def accept() -> None:
+            connection, _ = server.accept()
+
+            with connection:
+                handle(connection)
+
+        thread = threading.Thread(target=accept, daemon=True)
+        thread.start()
+        self.addCleanup(thread.join)
+
+    def test_not_running(self) -> None:
+        self.assertIsNone(request(self.path, ["list"]))
+
+    def test_closed_mid_request(self) -> None:
+        self.listen(recv_message)
+
+        with self.assertLogs("todo.daemon", "WARNING"):
+            response = request(self.path, ["list"])
+
+        assert response is not None
+        self.assertEqual(response["status"], 1)
+        self.assertIn("no response from the daemon", response["stderr"])
+
+    def test_no_response(self) -> None:
+        done = threading.Event()
+        self.listen(lambda connection: done.wait())
+        # Cleanups run in reverse, so this happens before the thread is joined.
+        self.addCleanup(done.set)
+
+        with (
+            mock.patch("todo.daemon._CLIENT_TIMEOUT", 0.1),
+            self.assertLogs("todo.daemon", "WARNING"),
+        ):
+            response = request(self.path, ["list"])
+
+        assert response is not None
+        self.assertEqual(response["status"], 1)
+
+    def test_no_response_is_not_retried(self) -> None:
+        received = []
+        done = threading.Event()
+
+        def handle(connection: socket.socket) -> None:
+            received.append(recv_message(connection))
+            done.wait()
+
+        self.listen(handle)
+        self.addCleanup(done.set)
+
+        stderr = io.StringIO()
+        env = {"XDG_RUNTIME_DIR": os.path.dirname(self.path)}
+
+        with (
+            mock.patch.dict(os.environ, env),
+            mock.patch("todo.daemon._CLIENT_TIMEOUT", 0.1),
+            mock.patch("todo.__main__.setup_logger"),
+            mock.patch("sqlite3.connect") as connect,
+            contextlib.redirect_stderr(stderr),
+            self.assertLogs("todo.daemon", "WARNING"),
+        ):
+            status = main(["add", "only once"])
+
+        # The daemon received the request, so it may have added the task;
+        # running the command locally as well could add it twice.
+        self.assertEqual(received, [{"argv": ["add", "only once"]}])
+        self.assertEqual(status, ExitCode.FAILURE)
+        self.assertIn("no response from the daemon", stderr.getvalue())
+        connect.assert_not_called()
+
+
+@unittest.skipIf(sys.platform == "win32", "requires Unix sockets")
+class TestServe(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "todo.sock")
+        self.env = os.environ | {
+            "HOME": directory.name,
+            "XDG_RUNTIME_DIR": directory.name,
+        }
+
+        daemon = subprocess.Popen(
+            [sys.executable, "-m", "todo", "daemon"],
+            env=self.env,
+            stderr=subprocess.DEVNULL,
+        )
+        self.addCleanup(daemon.wait)
+        self.addCleanup(daemon.terminate)
+
+        while not os.path.exists(self.path):
+            self.assertIsNone(daemon.poll())
+            time.sleep(0.01)
+
+    def test_idle_client(self) -> None:
+        # A client that connects but never sends anything must not block
+        # the requests that follow it.
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as idle:
+            idle.connect(self.path)
+            response = request(self.path, ["add", "--help"])
+
+        assert response is not None
+        self.assertEqual(response["status"], 0)
+        self.assertIn("usage:", response["stdout"])
+
+    def test_already_running(self) -> None:
+        result = subprocess.run(
+            [sys.executable, "-m", "todo", "daemon"],
+            env=self.env,
+            capture_output=True,
+            text=True,
+        )
+
+        self.assertEqual(result.returncode, ExitCode.FAILURE)
+        self.assertIn("already running", result.stderr)
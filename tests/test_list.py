@@ -0,0 +1,54 @@
+# The expected tables below are wider than the line length.
+# ruff: noqa: E501
+
+import os
+import time
+import unittest
+from unittest import mock
+
+from todo.commands.list import render_table
+
+
+class TestRenderTable(unittest.TestCase):
+    def setUp(self) -> None:
+        # The timestamps are shown in local time.
+        patcher = mock.patch.dict(os.environ, {"TZ": "UTC"})
+        patcher.start()
+        self.addCleanup(time.tzset)
+        self.addCleanup(patcher.stop)
+        time.tzset()
+
+    def test_rows(self) -> None:
+        rows = [
+            (7, "Buy milk", 2, 0, 0.0, 0.0),
+            (123, "Ünïcode", 1, 2, 86400.0, 90061.0),
+        ]
+
+        self.assertEqual(
+            render_table(rows),
+            "\n".join(
+                [
+                    "┌─────┬──────────┬──────────┬───────────┬──────────────────────────┬──────────────────────────┐",
+                    "│  ID │ Title    │ Priority │ Status    │ Created at               │ Updated at               │",
+                    "├─────┼──────────┼──────────┼───────────┼──────────────────────────┼──────────────────────────┤",
+                    "│  7  │ Buy milk │ HIGH     │ PENDING   │ 1970-01-01T00:00:00+0000 │ 1970-01-01T00:00:00+0000 │",
+                    "│ 123 │ Ünïcode  │ MEDIUM   │ COMPLETED │ 1970-01-02T00:00:00+0000 │ 1970-01-02T01:01:01+0000 │",
+                    "└─────┴──────────┴──────────┴───────────┴──────────────────────────┴──────────────────────────┘",
+                    "",
+                ]
+            ),
+        )
+
+    def test_empty(self) -> None:
+        self.assertEqual(
+            render_table([]),
+            "\n".join(
+                [
+                    "┌────┬───────┬──────────┬────────┬────────────┬────────────┐",
+                    "│ ID │ Title │ Priority │ Status │ Created at │ Updated at │",
+                    "├────┼───────┼──────────┼────────┼────────────┼────────────┤",
+                    "└────┴───────┴──────────┴────────┴────────────┴────────────┘",
+                    "",
+                ]
+            ),
+        )
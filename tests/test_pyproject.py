@@ -1,9 +1,13 @@
 import io
+import os
+import pathlib
+import tempfile
 import tomllib
 import unittest
 from typing import Any
+from unittest import mock
 
-from todo.pyproject import pyproject_update_env
+from todo.pyproject import find_pyproject, pyproject_init, pyproject_update_env
 
 
 class TestPyProject(unittest.TestCase):
@@ -21,3 +25,77 @@ class TestPyProject(unittest.TestCase):
 
         self.assertEqual(mock_env.get("PYPROJECT_NAME"), "foo")
         self.assertEqual(mock_env.get("PYPROJECT_VERSION"), "0.1.0")
+
+    def test_find_pyproject(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            expected = pathlib.Path(root, "pyproject.toml").resolve()
+            expected.touch()
+            nested = pathlib.Path(root, "a", "b")
+            nested.mkdir(parents=True)
+
+            self.assertEqual(find_pyproject(nested), expected)
+
+    def test_find_pyproject_stops_at_repository(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            pathlib.Path(root, "pyproject.toml").touch()
+            repository = pathlib.Path(root, "repository")
+            pathlib.Path(repository, ".git").mkdir(parents=True)
+
+            with self.assertRaises(FileNotFoundError):
+                find_pyproject(repository)
+
+    def test_find_pyproject_unreadable_parent(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            root = os.path.realpath(root)
+            expected = pathlib.Path(root, "pyproject.toml")
+            expected.touch()
+            nested = pathlib.Path(root, "nested")
+            nested.mkdir()
+            scandir = os.scandir
+
+            def search_only(path: str) -> Any:
+                # Simulates a directory with mode 0711 (as root, permissions
+                # on directories are not enforced).
+                if path == root:
+                    raise PermissionError(path)
+
+                return scandir(path)
+
+            with mock.patch("os.scandir", side_effect=search_only):
+                self.assertEqual(find_pyproject(nested), expected)
+
+    def test_init(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            pathlib.Path(root, "pyproject.toml").write_text(
+                '[project]\nname = "foo"  # comment\nversion = "0.1.0"\n'
+            )
+
+            with mock.patch.dict(os.environ):
+                pyproject_init(pathlib.Path(root))
+
+                self.assertEqual(os.environ.get("PYPROJECT_NAME"), "foo")
+                self.assertEqual(os.environ.get("PYPROJECT_VERSION"), "0.1.0")
+
+    def test_init_multiline_string(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            pathlib.Path(root, "pyproject.toml").write_text(
+                '[project]\nname = "real"\nversion = "0.1.0"\n'
+                'description = """\nname = "fake"\n"""\n'
+            )
+
+            with mock.patch.dict(os.environ):
+                pyproject_init(pathlib.Path(root))
+
+                self.assertEqual(os.environ.get("PYPROJECT_NAME"), "real")
+
+    def test_init_duplicate_key(self) -> None:
+        with tempfile.TemporaryDirectory() as root:
+            pathlib.Path(root, "pyproject.toml").write_text(
+                '[project]\nname = "a"\nversion = "0.1.0"\nname = "b"\n'
+            )
+
+            with (
+                mock.patch.dict(os.environ),
+                self.assertRaises(tomllib.TOMLDecodeError),
+            ):
+                pyproject_init(pathlib.Path(root))
@@ -0,0 +1,93 @@
+import datetime as dt
+import os
+import time
+import unittest
+from unittest import mock
+
+from todo.task import Priority, Row, Status, Task, serialize_tasks
+
+
+class TestTask(unittest.TestCase):
+    def test_as_dict_timestamps(self) -> None:
+        cases = {
+            dt.timezone(dt.timedelta(hours=5, minutes=30)): "+0530",
+            dt.timezone(-dt.timedelta(hours=3)): "-0300",
+            dt.timezone(dt.timedelta(minutes=19, seconds=32)): "+001932",
+            None: "",
+        }
+
+        for tz, suffix in cases.items():
+            value = dt.datetime(2026, 1, 2, 3, 4, 5, 678, tzinfo=tz)
+            task = Task(
+                id=1,
+                title="Buy milk",
+                priority=Priority.HIGH,
+                status=Status.PENDING,
+                created_at=value,
+                updated_at=value,
+            )
+
+            with self.subTest(tz=tz):
+                data = task.as_dict()
+                self.assertEqual(
+                    data["created_at"], "2026-01-02T03:04:05" + suffix
+                )
+                self.assertEqual(data["updated_at"], data["created_at"])
+
+    def test_serialize_tasks(self) -> None:
+        value = dt.datetime(2026, 1, 2, 3, 4, 5, tzinfo=dt.timezone.utc)
+        tasks = [
+            Task(
+                id=id,
+                title=f"Task {id}",
+                priority=priority,
+                status=status,
+                created_at=value,
+                updated_at=value + dt.timedelta(hours=id),
+            )
+            for id, (priority, status) in enumerate(
+                zip(Priority, Status, strict=True), start=1
+            )
+        ]
+
+        self.assertEqual(
+            serialize_tasks(tasks), [task.as_dict() for task in tasks]
+        )
+        self.assertEqual(
+            [task["priority"] for task in serialize_tasks(tasks)],
+            ["LOW", "MEDIUM", "HIGH"],
+        )
+
+    def test_from_rows(self) -> None:
+        # Daylight saving time starts on 2026-03-08 and ends on 2026-11-01
+        # in this time zone, so the rows span both changes.
+        patcher = mock.patch.dict(os.environ, {"TZ": "America/New_York"})
+        patcher.start()
+        self.addCleanup(time.tzset)
+        self.addCleanup(patcher.stop)
+        time.tzset()
+
+        utc = dt.timezone.utc
+        timestamps = [
+            dt.datetime(2026, 3, 8, 6, 59, 59, tzinfo=utc).timestamp(),
+            dt.datetime(2026, 3, 8, 7, 0, 0, tzinfo=utc).timestamp(),
+            dt.datetime(2026, 11, 1, 5, 59, 59, tzinfo=utc).timestamp(),
+            dt.datetime(2026, 11, 1, 6, 0, 0, tzinfo=utc).timestamp(),
+        ]
+        rows: list[Row] = [
+            (id, f"Task {id}", id % 3, id % 3, timestamp, timestamps[-id])
+            for id, timestamp in enumerate(timestamps, start=1)
+        ]
+
+        tasks = Task.from_rows(rows)
+
+        self.assertEqual(tasks, [Task.from_data(*row) for row in rows])
+        self.assertEqual(
+            [task.as_dict()["created_at"] for task in tasks],
+            [
+                "2026-03-08T01:59:59-0500",
+                "2026-03-08T03:00:00-0400",
+                "2026-11-01T01:59:59-0400",
+                "2026-11-01T01:00:00-0500",
+            ],
+        )